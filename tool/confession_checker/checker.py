@@ -1,14 +1,21 @@
 import os
+import hashlib
 import json
 import logging
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    orjson = None
 
+
+@dataclass(slots=True)
 class Entity:
-    def __init__(self, service_name: str):
-        self.service_name = service_name
-        self.methods: Dict[int, str] = {}
-        self.events: Dict[int, str] = {}
+    service_name: str
+    methods: Dict[int, str] = field(default_factory=dict)
+    events: Dict[int, str] = field(default_factory=dict)
 
 
 class DataBase:
@@ -16,67 +23,182 @@ class DataBase:
         self.db: Dict[int, Entity] = {}
 
     def add_to_db(self, id: int, entity: Entity):
-        if id in self.db:
-            dup = self.db[id]
-            logging.error(
+        dup = self.db.get(id)
+        if dup is not None:
+            raise ValueError(
                 f"Duplicate object with ID {id} found: {entity.service_name} conflicts with {dup.service_name}"
             )
-            exit(1)
         self.db[id] = entity
 
 
-def get_json_files(directory: str) -> List[str]:
-    """Retrieve all JSON files in the given directory and its subdirectories."""
-    json_files = []
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.json'):
-                json_files.append(os.path.join(root, file))
-    return json_files
+def get_json_files(directory: str) -> Iterator[str]:
+    """Yield all JSON files in the given directory and its subdirectories."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # Like os.walk, symlinked directories are neither entered nor
+            # reported as files
+            if entry.is_dir(follow_symlinks=False):
+                yield from get_json_files(entry.path)
+            elif entry.name.endswith('.json') and entry.is_file():
+                yield entry.path
+
+
+def read_file(filename: str) -> bytes:
+    """Read a whole file as raw bytes."""
+    with open(filename, 'rb') as file:
+        return file.read()
+
+
+def parse_json(raw: bytes):
+    """Parse raw JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _is_integer(value) -> bool:
+    """Check for a JSON integer; bool is an int subclass but not an ID."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def check_someip(data) -> Optional[Tuple[str, dict]]:
+    """Validate the "someip" section of a document and return its first service.
+
+    Returns None if the document defines no service, fills in empty "methods"
+    and "events" maps, and raises ValueError describing the first problem found.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("top-level JSON value must be an object")
+    someip_data = data.get("someip")
+    if not someip_data:
+        return None
+    if not isinstance(someip_data, dict):
+        raise ValueError("'someip' must be an object")
+
+    # Extract the first service (e.g., "ServoService")
+    service_name, service_data = next(iter(someip_data.items()))
+    path = f"someip.{service_name}"
+    if not isinstance(service_data, dict):
+        raise ValueError(f"{path} must be an object")
+    if "service_id" not in service_data:
+        raise ValueError(f"{path} is missing 'service_id'")
+    if not _is_integer(service_data["service_id"]):
+        raise ValueError(f"{path}.service_id must be an integer")
+    for kind in ("methods", "events"):
+        items = service_data.setdefault(kind, {})
+        if not isinstance(items, dict):
+            raise ValueError(f"{path}.{kind} must be an object")
+        for name, info in items.items():
+            if not isinstance(info, dict):
+                raise ValueError(f"{path}.{kind}.{name} must be an object")
+            if "id" not in info:
+                raise ValueError(f"{path}.{kind}.{name} is missing 'id'")
+            if not _is_integer(info["id"]):
+                raise ValueError(f"{path}.{kind}.{name}.id must be an integer")
+    return service_name, service_data
+
+
+def invert_id_map(items: Dict[str, dict], kind: str) -> Dict[int, str]:
+    """Map each item's "id" to its name, failing on duplicate IDs."""
+    pairs = [(info["id"], name) for name, info in items.items()]
+    id_map = dict(pairs)
+    if len(id_map) != len(pairs):
+        # Only locate the offending ID once the cheap check has failed,
+        # reporting the first collision in file order
+        seen: Dict[int, str] = {}
+        for item_id, name in pairs:
+            if item_id in seen:
+                raise ValueError(
+                    f"Duplicate {kind} ID {item_id} for {kind} {name} and {seen[item_id]}"
+                )
+            seen[item_id] = name
+    return id_map
 
 
 def load_json(filename: str):
-    """Load and parse a JSON file into Entity objects."""
-    with open(filename, 'r') as file:
-        data = json.load(file)
-
-        # Access the "someip" key
-        someip_data = data.get("someip", {})
-        if not someip_data:
-            logging.error(f"No 'someip' key found in file {filename}")
-            return None, None
-
-        # Extract the first service (e.g., "ServoService")
-        service_name = next(iter(someip_data.keys()))
-        service_data = someip_data[service_name]
-
-        service_id = service_data["service_id"]
-        methods = service_data.get("methods", {})
-        events = service_data.get("events", {})
-
-        entity = Entity(service_name)
-
-        # Process methods
-        for method_name, method_info in methods.items():
-            method_id = method_info["id"]
-            if method_id in entity.methods:
-                logging.error(
-                    f"Duplicate method ID {method_id} for method {method_name} and {entity.methods[method_id]}"
-                )
-                exit(1)
-            entity.methods[method_id] = method_name
-
-        # Process events
-        for event_name, event_info in events.items():
-            event_id = event_info["id"]
-            if event_id in entity.events:
-                logging.error(
-                    f"Duplicate event ID {event_id} for event {event_name} and {entity.events[event_id]}"
-                )
-                exit(1)
-            entity.events[event_id] = event_name
-
-        return service_id, entity
+    """Load and parse a JSON file into Entity objects.
+
+    Nothing is logged here so that all diagnostics come from the merge loop:
+    (None, None) is returned for files without a "someip" key and errors are
+    raised.
+    """
+    service = check_someip(parse_json(read_file(filename)))
+    if service is None:
+        return None, None
+    service_name, service_data = service
+
+    service_id = service_data["service_id"]
+    methods = service_data["methods"]
+    events = service_data["events"]
+
+    entity = Entity(
+        service_name,
+        methods=invert_id_map(methods, "method"),
+        events=invert_id_map(events, "event"),
+    )
+
+    return service_id, entity
+
+
+# Parsed results of unchanged files are reused across runs
+CACHE_FILE = "./.checker_cache.json"
+
+CacheEntry = Tuple[int, int, Optional[int], Optional[Entity]]
+
+
+def cache_version() -> str:
+    """Identify the checker that produced cached results.
+
+    Covers this source file and the JSON parser in use, since orjson and the
+    stdlib parser accept different input, so entries written by a different
+    checker are never trusted.
+    """
+    with open(__file__, 'rb') as file:
+        digest = hashlib.sha256(file.read())
+    parser = f"orjson {orjson.__version__}" if orjson is not None else "json"
+    digest.update(parser.encode())
+    return digest.hexdigest()
+
+
+def load_cache(filename: str, version: str) -> Dict[str, CacheEntry]:
+    """Load the parse cache, starting empty if it is missing, unreadable or stale."""
+    try:
+        with open(filename, 'rb') as file:
+            cache = json.loads(file.read())
+        if cache["version"] != version:
+            return {}
+        entries = {}
+        for path, (mtime, size, service_id, service_name, methods, events) in cache["entries"].items():
+            entity = None
+            if service_id is not None:
+                entity = Entity(service_name, dict(methods), dict(events))
+            entries[path] = (mtime, size, service_id, entity)
+        return entries
+    except (OSError, ValueError, KeyError, IndexError, TypeError, AttributeError):
+        # Any malformed cache is discarded and every file is parsed again
+        return {}
+
+
+def save_cache(filename: str, version: str, entries: Dict[str, CacheEntry]):
+    """Write the parse cache back to disk, warning instead of failing."""
+    cache = {"version": version, "entries": {}}
+    for path, (mtime, size, service_id, entity) in entries.items():
+        if entity is None:
+            cache["entries"][path] = [mtime, size, None, None, [], []]
+        else:
+            cache["entries"][path] = [
+                mtime,
+                size,
+                service_id,
+                entity.service_name,
+                list(entity.methods.items()),
+                list(entity.events.items()),
+            ]
+    try:
+        with open(filename, 'w') as file:
+            json.dump(cache, file)
+    except OSError as e:
+        logging.warning("Could not write cache %s: %s", filename, e)
 
 
 # Main usage
@@ -84,10 +206,46 @@ if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     db = DataBase()
     folder_path = "./someip"  # Directory containing JSON files
-
-    json_files = get_json_files(folder_path)
+    if not os.path.isdir(folder_path):
+        logging.error("Directory %s not found, run from the repository root", folder_path)
+        exit(1)
+
+    # Results are merged into the database in sorted order so that the
+    # reported conflicts do not depend on directory listing order.
+    json_files = sorted(get_json_files(folder_path))
+    # Files whose (mtime, size) match the cache are not parsed again.
+    version = cache_version()
+    cache = load_cache(CACHE_FILE, version)
+    new_cache: Dict[str, CacheEntry] = {}
+    # Errors are collected rather than fatal so every conflict is reported
+    errors = 0
     for json_file in json_files:
-        logging.info(f"Processing file: {json_file}")
-        service_id, entity = load_json(json_file)
-        if (service_id is not None and entity is not None):
+        logging.info("Processing file: %s", json_file)
+        st = os.stat(json_file)
+        stamp = (st.st_mtime_ns, st.st_size)
+        entry = cache.get(json_file)
+        if entry is not None and entry[:2] == stamp:
+            service_id, entity = entry[2:]
+        else:
+            try:
+                service_id, entity = load_json(json_file)
+            except ValueError as e:
+                logging.error("%s: %s", json_file, e)
+                errors += 1
+                continue
+        # Only files that parsed cleanly are cached
+        new_cache[json_file] = (*stamp, service_id, entity)
+        if (service_id is None or entity is None):
+            logging.error("No 'someip' key found in file %s", json_file)
+            continue
+        try:
             db.add_to_db(service_id, entity)
+        except ValueError as e:
+            logging.error("%s: %s", json_file, e)
+            errors += 1
+
+    save_cache(CACHE_FILE, version, new_cache)
+
+    if errors:
+        logging.error("Found %d error(s)", errors)
+        exit(1)